@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'order.profiling.SamplingProfilerMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -86,6 +87,40 @@ DATABASES = {
 }
 
 
+# shared by every worker on the host, so a logout or a barcode change is seen by all of them,
+# point them at memcached or redis when the app runs on more than one host. Sessions get their own
+# alias, a full cache culls random entries and the small generation keys of 'default' must survive
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'default'),
+    },
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'sessions'),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# sessions are read from the shared cache and written through to the database,
+# the resolved staff user is kept per process for STAFF_USER_CACHE_TTL seconds
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+AUTHENTICATION_BACKENDS = ['order.backends.CachedModelBackend']
+STAFF_USER_CACHE_TTL = 30
+
+
+# sampling profiler, off while both are empty. PROFILER_SAMPLE_RATE is the fraction of requests
+# to profile, PROFILER_ROUTES url names to always profile, e.g. ['ajax_add', 'ajax-search']
+PROFILER_SAMPLE_RATE = 0
+PROFILER_ROUTES = []
+PROFILER_INTERVAL = 0.001
+# the sampled stacks are summed per process and appended to PROFILER_DIR/<view name>/<hour>.folded
+# every PROFILER_FLUSH_INTERVAL seconds, "manage.py profile_report --prune 168" removes old hours
+PROFILER_FLUSH_INTERVAL = 10
+PROFILER_DIR = os.path.join(BASE_DIR, 'profiles')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/2.0/ref/settings/#auth-password-validators
 
@@ -123,5 +158,34 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/2.0/howto/static-files/
 
 STATIC_URL = '/static/'
+STATIC_ROOT = os.path.join(BASE_DIR, 'static_root')
+STATICFILES_STORAGE = 'order.storage.CompressedManifestStaticFilesStorage'
+# swaps in the plain storage, so the tests don't need a collectstatic run
+TEST_RUNNER = 'blog_pos.test_runner.TestRunner'
+
+# the files of include/css.html and include/js.html, "manage.py build_assets" bundles them into order/static/bundles
+ASSET_BUNDLES = {
+    'app.css': [
+        'assets/libs/fullcalendar/dist/fullcalendar.min.css',
+        'assets/extra-libs/calendar/calendar.css',
+        'dist/css/style.min.css',
+    ],
+    'app.js': [
+        'assets/libs/jquery/dist/jquery.min.js',
+        'dist/js/jquery.ui.touch-punch-improved.js',
+        'dist/js/jquery-ui.min.js',
+        'assets/libs/popper.js/dist/umd/popper.min.js',
+        'assets/libs/bootstrap/dist/js/bootstrap.min.js',
+        'assets/libs/perfect-scrollbar/dist/perfect-scrollbar.jquery.min.js',
+        'assets/extra-libs/sparkline/sparkline.js',
+        'dist/js/waves.js',
+        'dist/js/sidebarmenu.js',
+        'dist/js/custom.min.js',
+        'assets/libs/moment/min/moment.min.js',
+        'assets/libs/fullcalendar/dist/fullcalendar.min.js',
+        'dist/js/pages/calendar/cal-init.js',
+    ],
+}
+ASSET_BUNDLES_ENABLED = not DEBUG
 
 CURRENCY = '€'
\ No newline at end of file
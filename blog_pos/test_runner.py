@@ -0,0 +1,20 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests with the plain static files storage, the manifest storage needs a collectstatic
+    run first and would make every template using {% static %} depend on the local STATIC_ROOT.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.static_settings = override_settings(
+            STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage'
+        )
+        self.static_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.static_settings.disable()
+        super().teardown_test_environment(**kwargs)
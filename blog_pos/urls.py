@@ -1,11 +1,13 @@
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path
+from django.urls import path, re_path
 
 from order.views import (HomepageView, OrderUpdateView, CreateOrderView, delete_order,
                          OrderListView, done_order_view, auto_create_order_view,
                          ajax_add_product, ajax_modify_order_item, ajax_search_products, ajax_calculate_results_view,
-                         order_action_view, ajax_calculate_category_view
+                         order_action_view, ajax_calculate_category_view, ajax_scan_product
                          )
+from order.assets import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -22,8 +24,14 @@ urlpatterns = [
     #  ajax_calls
     path('ajax/search-products/<int:pk>/', ajax_search_products, name='ajax-search'),
     path('ajax/add-product/<int:pk>/<int:dk>/', ajax_add_product, name='ajax_add'),
+    path('ajax/scan-product/<int:pk>/', ajax_scan_product, name='ajax_scan'),
     path('ajax/modify-product/<int:pk>/<slug:action>', ajax_modify_order_item, name='ajax_modify'),
     path('ajax/calculate-results/', ajax_calculate_results_view, name='ajax_calculate_result'),
     path('ajax/calculate-category-results/', ajax_calculate_category_view, name='ajax_category_result'),
 
 ]
+
+if not settings.DEBUG:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), serve_static),
+    ]
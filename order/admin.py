@@ -1,3 +1,60 @@
 from django.contrib import admin
 
-# Register your models here.
+from product.admin import ScalableModelAdmin
+from product.models import Product
+from .models import Order, OrderItem
+
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+    raw_id_fields = ['product']
+    fields = ['product', 'qty', 'price', 'discount_price', 'tag_final_price', 'tag_total_price']
+    readonly_fields = ['tag_final_price', 'tag_total_price']
+
+
+@admin.register(Order)
+class OrderAdmin(ScalableModelAdmin):
+    list_display = ['id', 'date', 'title', 'tag_value', 'tag_discount', 'tag_final_value', 'is_paid']
+    list_filter = ['is_paid']
+    search_fields = ['=id', 'title']
+    list_per_page = 50
+    fields = ['date', 'title', 'discount', 'is_paid', 'tag_value', 'tag_final_value']
+    readonly_fields = ['tag_value', 'tag_final_value']
+    inlines = [OrderItemInline]
+    actions = ['mark_paid', 'mark_unpaid']
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if search_term.isdigit():
+            return queryset.filter(id=search_term), False
+        return queryset.filter(Order.search_q(search_term)), False
+
+    def mark_paid(self, request, queryset):
+        updated = queryset.update(is_paid=True)
+        self.message_user(request, f'{updated} orders marked as paid.')
+    mark_paid.short_description = 'Mark selected orders as paid'
+
+    def mark_unpaid(self, request, queryset):
+        updated = queryset.update(is_paid=False)
+        self.message_user(request, f'{updated} orders marked as unpaid.')
+    mark_unpaid.short_description = 'Mark selected orders as unpaid'
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(ScalableModelAdmin):
+    list_display = ['order', 'product', 'qty', 'tag_price', 'tag_discount', 'tag_final_price']
+    list_select_related = ['order', 'product']
+    search_fields = ['=order__id', 'product__title']
+    list_per_page = 50
+    raw_id_fields = ['order', 'product']
+    fields = ['order', 'product', 'qty', 'price', 'discount_price', 'tag_final_price', 'tag_total_price']
+    readonly_fields = ['tag_final_price', 'tag_total_price']
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if search_term.isdigit():
+            return queryset.filter(order_id=search_term), False
+        return queryset.filter(Product.search_q(search_term, field='product_id')), False
@@ -0,0 +1,129 @@
+import mimetypes
+import os
+import posixpath
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+BUNDLE_DIR = 'bundles'
+BUNDLE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', BUNDLE_DIR)
+IMPORT_RE = re.compile(r'''@import\s+(?:url\()?\s*["']?([^"')\s;]+)["']?\s*\)?[^;]*;''')
+URL_RE = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+IS_EXTERNAL = ('data:', 'http:', 'https:', '//', '#', '/')
+# (suffix, Content-Encoding) in order of preference
+ENCODINGS = [('.br', 'br'), ('.gz', 'gzip')]
+FAR_FUTURE = 'public, max-age=31536000, immutable'
+
+
+def find_static(path):
+    full_path = finders.find(path)
+    if full_path is None:
+        raise ValueError(f'The static file {path} could not be found.')
+    return full_path
+
+
+def rewrite_css_urls(text, path):
+    """ Makes every relative url() of the css file at `path` relative to the bundle directory. """
+    def convert(match):
+        quote, url = match.groups()
+        if url.startswith(IS_EXTERNAL):
+            return match.group(0)
+        url_path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(path), url_path))
+        if target.startswith('..'):
+            # already points outside the static root, leave it as the vendor wrote it
+            return match.group(0)
+        return f'url({quote}{posixpath.relpath(target, BUNDLE_DIR)}{suffix}{quote})'
+    return URL_RE.sub(convert, text)
+
+
+def read_css(path, remote_imports, seen):
+    """ Returns the css of `path` with its local @imports inlined, remote @imports are collected. """
+    if path in seen:
+        return ''
+    seen.add(path)
+    with open(find_static(path), encoding='utf-8') as f:
+        text = f.read()
+    inlined = []
+    for match in IMPORT_RE.finditer(text):
+        url = match.group(1)
+        if url.startswith(IS_EXTERNAL):
+            if match.group(0) not in remote_imports:
+                remote_imports.append(match.group(0))
+        else:
+            import_path = posixpath.normpath(posixpath.join(posixpath.dirname(path), url.split('?')[0]))
+            inlined.append(read_css(import_path, remote_imports, seen))
+    text = rewrite_css_urls(IMPORT_RE.sub('', text), path)
+    return '\n'.join(inlined + [text])
+
+
+def build_css(paths):
+    remote_imports, seen, parts = [], set(), []
+    for path in paths:
+        parts.append(read_css(path, remote_imports, seen))
+    return '\n'.join(remote_imports + parts), seen
+
+
+def build_js(paths):
+    parts = []
+    for path in paths:
+        with open(find_static(path), encoding='utf-8') as f:
+            parts.append(f.read())
+    return '\n;\n'.join(parts), set(paths)
+
+
+def build_bundles():
+    """
+    Writes every bundle of settings.ASSET_BUNDLES to order/static/bundles and returns a dict
+    of bundle name -> the static files it replaces, @imported stylesheets included.
+    """
+    os.makedirs(BUNDLE_ROOT, exist_ok=True)
+    sources = dict()
+    for name, paths in settings.ASSET_BUNDLES.items():
+        content, sources[name] = build_css(paths) if name.endswith('.css') else build_js(paths)
+        with open(os.path.join(BUNDLE_ROOT, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+    return sources
+
+
+@lru_cache(maxsize=None)
+def hashed_paths():
+    return frozenset(getattr(staticfiles_storage, 'hashed_files', {}).values())
+
+
+def serve_static(request, path):
+    """
+    Serves collected files from STATIC_ROOT, preferring the precompressed copies written by
+    CompressedManifestStaticFilesStorage. Fingerprinted names never change, so they are cached for a year.
+    """
+    try:
+        full_path = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+    stat = os.stat(full_path)
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime, stat.st_size):
+        return HttpResponseNotModified()
+    content_type, _ = mimetypes.guess_type(full_path)
+    accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    content_encoding = None
+    for suffix, name in ENCODINGS:
+        if name in accept_encoding and os.path.isfile(full_path + suffix):
+            full_path, content_encoding = full_path + suffix, name
+            break
+    response = FileResponse(open(full_path, 'rb'), content_type=content_type or 'application/octet-stream')
+    if content_encoding:
+        response['Content-Encoding'] = content_encoding
+    response['Vary'] = 'Accept-Encoding'
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = FAR_FUTURE if path in hashed_paths() else 'no-cache'
+    return response
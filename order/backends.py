@@ -0,0 +1,58 @@
+import copy
+import time
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from product.cache import current_generation, new_generation
+
+GENERATION_KEY = 'staff_user:{}:generation'
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend that keeps the users it resolved from the session for STAFF_USER_CACHE_TTL seconds,
+    so the AJAX calls of the till don't query auth_user on every keystroke. Every hit is checked
+    against the user's generation token in the shared cache, saving or deleting a user changes it
+    once the transaction commits and every process loads the user again on its next request.
+    """
+    users = dict()
+    lock = Lock()
+
+    def get_user(self, user_id):
+        now = time.monotonic()
+        # read before the query, a change committed in between makes the next request reload
+        generation = current_generation(GENERATION_KEY.format(user_id))
+        cached = self.users.get(user_id)
+        if cached is not None and cached[0] > now and cached[1] == generation:
+            return copy.copy(cached[2])
+        user = super().get_user(user_id)
+        if user is not None:
+            with self.lock:
+                self.users[user_id] = (now + settings.STAFF_USER_CACHE_TTL, generation, user)
+            user = copy.copy(user)
+        return user
+
+    @classmethod
+    def forget(cls, user_id):
+        with cls.lock:
+            cls.users.pop(user_id, None)
+
+    @classmethod
+    def invalidate(cls, user_id):
+        new_generation(GENERATION_KEY.format(user_id))
+        cls.forget(user_id)
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    CachedModelBackend.forget(user_id)
+    transaction.on_commit(lambda: CachedModelBackend.invalidate(user_id))
+
+
+post_save.connect(invalidate_cached_user, sender=get_user_model())
+post_delete.connect(invalidate_cached_user, sender=get_user_model())
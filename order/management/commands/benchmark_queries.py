@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from product.models import Product, Barcode
+from order.models import Order
+from order.backends import CachedModelBackend
+
+CONFIGURATIONS = [
+    ('database sessions, ModelBackend', {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+        'AUTHENTICATION_BACKENDS': ['django.contrib.auth.backends.ModelBackend'],
+    }),
+    ('cached sessions, CachedModelBackend', {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db',
+        'AUTHENTICATION_BACKENDS': ['order.backends.CachedModelBackend'],
+    }),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Counts the queries of the AJAX routes with database sessions and with the cached session/auth path.'
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run_benchmark()
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run_benchmark(self):
+        user = User.objects.create_user('benchmark_queries', password='benchmark', is_staff=True)
+        product = Product.objects.create(title='Benchmark Query Product', value=5, qty=100)
+        Barcode.objects.create(product=product, code='BENCHQUERIES')
+        order = Order.objects.create(title='Benchmark Order')
+        order_item = order.order_items.create(product=product, price=product.value)
+        routes = [
+            ('search', reverse('ajax-search', kwargs={'pk': order.id}) + '?q=Bench'),
+            ('add', reverse('ajax_add', kwargs={'pk': order.id, 'dk': product.id})),
+            ('scan', reverse('ajax_scan', kwargs={'pk': order.id}) + '?code=BENCHQUERIES'),
+            ('modify', reverse('ajax_modify', kwargs={'pk': order_item.id, 'action': 'add'})),
+            ('results', reverse('ajax_calculate_result')),
+        ]
+        for label, overrides in CONFIGURATIONS:
+            with override_settings(ALLOWED_HOSTS=['testserver'], **overrides):
+                for alias in settings.CACHES:
+                    caches[alias].clear()
+                CachedModelBackend.users.clear()
+                client = Client()
+                if not client.login(username=user.username, password='benchmark'):
+                    raise CommandError('Could not log in the benchmark user.')
+                client.get(routes[0][1])  # warm up the caches
+                self.stdout.write(label)
+                for name, url in routes:
+                    with CaptureQueriesContext(connection) as queries:
+                        response = client.get(url)
+                    if response.status_code != 200:
+                        raise CommandError(f'{url} returned {response.status_code}')
+                    overhead = [query for query in queries.captured_queries
+                                if 'django_session' in query['sql'] or '"auth_user"' in query['sql']]
+                    self.stdout.write(f'  {name:8} {len(queries):3} queries, {len(overhead)} session/auth')
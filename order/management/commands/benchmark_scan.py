@@ -0,0 +1,81 @@
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+
+from product.models import Product, Barcode
+from product.barcodes import barcode_index
+from order.models import Order
+from order.views import ajax_scan_product
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Times barcode lookups and the scan endpoint on a generated catalog, the data is rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skus', type=int, default=100000)
+        parser.add_argument('--scans', type=int, default=200)
+        parser.add_argument('--budget', type=float, default=10, help='Latency budget of one scan in ms.')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run_benchmark(options['skus'], options['scans'], options['budget'])
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            barcode_index.clear()
+
+    def run_benchmark(self, skus, scans, budget):
+        start = time.perf_counter()
+        Product.objects.bulk_create(
+            [Product(title=f'Benchmark SKU {i}', value=1, final_value=1, qty=scans) for i in range(skus)],
+            batch_size=500
+        )
+        product_ids = Product.objects.filter(title__startswith='Benchmark SKU').values_list('id', flat=True)
+        Barcode.objects.bulk_create([Barcode(product_id=product_id, code=f'BENCH{product_id:012d}')
+                                     for product_id in product_ids], batch_size=500)
+        codes = list(Barcode.objects.filter(code__startswith='BENCH').values_list('code', flat=True))
+        self.stdout.write(f'Created {len(codes)} products with barcodes in {time.perf_counter() - start:.1f}s')
+
+        barcode_index.clear()
+        start = time.perf_counter()
+        barcode_index.ensure_loaded()
+        self.stdout.write(f'Index load: {(time.perf_counter() - start) * 1000:.0f} ms '
+                          f'for {len(barcode_index.codes)} codes')
+
+        sample = codes[::max(len(codes) // 1000, 1)]
+        start = time.perf_counter()
+        for code in sample:
+            barcode_index.get(code)
+        index_us = (time.perf_counter() - start) / len(sample) * 1000000
+        start = time.perf_counter()
+        for code in sample:
+            Barcode.objects.filter(code=code).values_list('product_id', flat=True).first()
+        db_us = (time.perf_counter() - start) / len(sample) * 1000000
+        self.stdout.write(f'Lookup: index {index_us:.2f} us, indexed database query {db_us:.0f} us')
+
+        user = User.objects.create(username='benchmark_scan', is_staff=True, is_active=True)
+        order = Order.objects.create(title='Benchmark Order')
+        factory, timings = RequestFactory(), []
+        for i in range(scans):
+            request = factory.get('/', {'code': sample[i % min(len(sample), 20)]})
+            request.user = user
+            start = time.perf_counter()
+            response = ajax_scan_product(request, pk=order.id)
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f'Scan returned {response.status_code}')
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(f'Scan endpoint: p50 {statistics.median(timings):.2f} ms, p95 {p95:.2f} ms, '
+                          f'max {timings[-1]:.2f} ms, budget {budget} ms '
+                          f'{"met" if p95 <= budget else "MISSED"} at p95')
@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.template import Context
+from django.test import RequestFactory
+from django_tables2 import RequestConfig
+
+from product.models import Product, Category
+from order.models import Order, OrderItem
+from order.renderers import order_item_renderer, product_renderer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compares the fast table renderers against django_tables2, the sample data is rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=12)
+        parser.add_argument('--repeat', type=int, default=200)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run_benchmark(options['rows'], options['repeat'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run_benchmark(self, rows, repeat):
+        category = Category.objects.create(title='Benchmark <Category>')
+        order = Order.objects.create(title='Benchmark Order')
+        for i in range(rows):
+            product = Product.objects.create(title=f'Benchmark "{i}" & co', category=category if i % 2 else None,
+                                             value=10 + i, discount_value=i % 3, qty=100)
+            OrderItem.objects.create(order=order, product=product, qty=i + 1, price=product.value,
+                                     discount_price=product.discount_value)
+        products = Product.objects.filter(title__startswith='Benchmark')[:rows]
+        request = RequestFactory().get('/', {'q': 'Benchmark'})
+
+        for label, renderer, queryset in [('order items', order_item_renderer, order.order_items.all()),
+                                          ('products', product_renderer, products)]:
+            def render_table():
+                table = renderer.table_class(queryset)
+                RequestConfig(request).configure(table)
+                return renderer.fallback_template.render(
+                    Context({'table': table, 'request': request, 'instance': order})
+                )
+
+            def render_fast():
+                return renderer.render(request, queryset, order)
+
+            if render_table() != render_fast():
+                raise CommandError(f'The fast renderer output for {label} differs from django_tables2.')
+            results = []
+            for func in (render_table, render_fast):
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    func()
+                results.append((time.perf_counter() - start) / (repeat * max(rows, 1)) * 1000000)
+            self.stdout.write(f'{label}: django_tables2 {results[0]:.1f} us/row, fast {results[1]:.1f} us/row, '
+                              f'{results[0] / results[1]:.1f}x faster, output identical')
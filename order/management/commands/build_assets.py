@@ -0,0 +1,58 @@
+import gzip
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from order.assets import BUNDLE_DIR, build_bundles, find_static
+from order.storage import brotli
+
+
+def size(path):
+    return os.path.getsize(path) if os.path.exists(path) else None
+
+
+class Command(BaseCommand):
+    help = 'Bundles ASSET_BUNDLES, collects the fingerprinted and precompressed static files ' \
+           'and reports the bytes and requests every page needs before and after.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-collect', action='store_true', help='Only write the bundles.')
+
+    def handle(self, *args, **options):
+        sources = build_bundles()
+        if options['no_collect']:
+            self.stdout.write(f'Wrote {len(sources)} bundles.')
+            return
+        call_command('collectstatic', interactive=False, verbosity=0)
+        staticfiles_storage.load_manifest()
+
+        before_requests, before_bytes, before_gzip = 0, 0, 0
+        after = {'raw': 0, 'gzip': 0, 'br': 0}
+        for name, paths in sources.items():
+            for path in paths:
+                with open(find_static(path), 'rb') as f:
+                    content = f.read()
+                before_requests += 1
+                before_bytes += len(content)
+                before_gzip += len(gzip.compress(content))
+            collected = os.path.join(settings.STATIC_ROOT, staticfiles_storage.stored_name(f'{BUNDLE_DIR}/{name}'))
+            raw, compressed_gzip, compressed_br = size(collected), size(collected + '.gz'), size(collected + '.br')
+            after['raw'] += raw
+            after['gzip'] += compressed_gzip or raw
+            after['br'] += compressed_br or compressed_gzip or raw
+            self.stdout.write(f'{name}: {len(paths)} files -> {os.path.relpath(collected, settings.STATIC_ROOT)}, '
+                              f'{raw} bytes, {compressed_gzip} gzip, {compressed_br or "-"} brotli')
+
+        self.stdout.write('Per page (include/css.html + include/js.html), most sources are minified already:')
+        self.stdout.write(f'  requests: {before_requests} -> {len(sources)}')
+        self.stdout.write(f'  raw:      {before_bytes} -> {after["raw"]} bytes')
+        self.stdout.write(f'  gzip:     {before_gzip} -> {after["gzip"]} bytes '
+                          f'({1 - after["gzip"] / before_gzip:.1%} fewer)')
+        if brotli is not None:
+            self.stdout.write(f'  brotli:   {after["br"]} bytes')
+        else:
+            self.stdout.write('  install brotli for .br files')
+        self.stdout.write(f'  repeat visits: {len(sources)} -> 0 revalidations, the bundles are cached for a year')
@@ -0,0 +1,81 @@
+import os
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Merges the folded stacks written by SamplingProfilerMiddleware and lists the hottest functions, ' \
+           'or deletes the old ones with --prune.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=float, default=24, help='Only read profiles of the last N hours.')
+        parser.add_argument('--view', help='Only read profiles of this view name.')
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument('--output', help='Write the merged stacks to this file, for flamegraph.pl or speedscope.')
+        parser.add_argument('--prune', type=float, metavar='HOURS',
+                            help='Only delete the profiles older than HOURS, e.g. from a daily cron job.')
+
+    def profile_files(self):
+        """ Yields (view name, path) of every folded stack file in PROFILER_DIR. """
+        if not os.path.isdir(settings.PROFILER_DIR):
+            return
+        for view_name in sorted(os.listdir(settings.PROFILER_DIR)):
+            directory = os.path.join(settings.PROFILER_DIR, view_name)
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith('.folded'):
+                    yield view_name, os.path.join(directory, filename)
+
+    def prune(self, before):
+        deleted = 0
+        for view_name, path in list(self.profile_files()):
+            if os.path.getmtime(path) < before:
+                os.remove(path)
+                deleted += 1
+                if not os.listdir(os.path.dirname(path)):
+                    os.rmdir(os.path.dirname(path))
+        return deleted
+
+    def read_profiles(self, since, view):
+        stacks, views = Counter(), Counter()
+        for view_name, path in self.profile_files():
+            if view and view_name != view.replace(':', '.') or os.path.getmtime(path) < since:
+                continue
+            with open(path) as f:
+                for line in f:
+                    stack, _, count = line.rstrip('\n').rpartition(' ')
+                    stacks[stack] += int(count)
+                    views[view_name] += int(count)
+        return stacks, views
+
+    def handle(self, *args, **options):
+        if options['prune'] is not None:
+            deleted = self.prune(time.time() - options['prune'] * 3600)
+            self.stdout.write(f'Deleted {deleted} profiles older than {options["prune"]:g} hours.')
+            return
+        stacks, views = self.read_profiles(time.time() - options['hours'] * 3600, options['view'])
+        if not stacks:
+            raise CommandError(f'No profiles found in {settings.PROFILER_DIR}.')
+        total = sum(stacks.values())
+        own, inclusive = Counter(), Counter()
+        for stack, count in stacks.items():
+            functions = stack.split(';')
+            own[functions[-1]] += count
+            for function in set(functions):
+                inclusive[function] += count
+
+        self.stdout.write(f'{total} samples')
+        for view_name, count in views.most_common():
+            self.stdout.write(f'  {count:8} {count / total:6.1%}  {view_name}')
+        self.stdout.write(f'\nHottest functions by own samples:\n{"own":>8} {"own %":>7} {"total %":>8}  function')
+        for function, count in own.most_common(options['top']):
+            self.stdout.write(f'{count:8} {count / total:7.1%} {inclusive[function] / total:8.1%}  {function}')
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.writelines(f'{stack} {count}\n' for stack, count in stacks.most_common())
+            self.stdout.write(f'\nMerged stacks written to {options["output"]}')
@@ -0,0 +1,34 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:02
+
+import datetime
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0002_order_date'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='order',
+            options={'ordering': ['-date']},
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='date',
+            field=models.DateField(db_index=True, default=datetime.datetime(2026, 10, 19, 14, 2, 11, 981866)),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='title',
+            field=models.CharField(blank=True, db_index=True, max_length=150),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='order',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_items', to='order.Order'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+from product.money import cents_operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0003_order_indexes'),
+    ]
+
+    operations = [
+        *cents_operations('order', 'order', 'value', 20),
+        *cents_operations('order', 'order', 'discount', 20),
+        *cents_operations('order', 'order', 'final_value', 20),
+        *cents_operations('order', 'orderitem', 'price', 20),
+        *cents_operations('order', 'orderitem', 'discount_price', 20),
+        *cents_operations('order', 'orderitem', 'final_price', 20),
+        *cents_operations('order', 'orderitem', 'total_price', 20),
+    ]
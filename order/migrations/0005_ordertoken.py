@@ -0,0 +1,29 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from product.search import build_search_tokens
+
+
+def build_tokens(apps, schema_editor):
+    build_search_tokens(apps.get_model('order', 'Order'), apps.get_model('order', 'OrderToken'), 'order_id')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0004_money_cents'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(db_index=True, max_length=150)),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tokens', to='order.Order')),
+            ],
+        ),
+        migrations.RunPython(build_tokens, migrations.RunPython.noop),
+    ]
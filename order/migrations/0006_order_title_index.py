@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-19 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0005_ordertoken'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='title',
+            field=models.CharField(blank=True, max_length=150),
+        ),
+    ]
@@ -6,8 +6,9 @@ from django.dispatch import receiver
 from django.db.models.signals import post_delete
 import datetime
 from product.models import Product
+from product.money import MoneyField, format_money
+from product.search import SearchTokensMixin
 
-from decimal import Decimal
 CURRENCY = settings.CURRENCY
 
 
@@ -17,13 +18,13 @@ class OrderManager(models.Manager):
         return self.filter(active=True)
 
 
-class Order(models.Model):
-    date = models.DateField(default=datetime.datetime.now())
+class Order(SearchTokensMixin, models.Model):
+    date = models.DateField(default=datetime.datetime.now(), db_index=True)
     title = models.CharField(blank=True, max_length=150)
     timestamp = models.DateField(auto_now_add=True)
-    value = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
-    discount = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
-    final_value = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
+    value = MoneyField(default=0)
+    discount = MoneyField(default=0)
+    final_value = MoneyField(default=0)
     is_paid = models.BooleanField(default=True)
     objects = models.Manager()
     browser = OrderManager()
@@ -33,8 +34,8 @@ class Order(models.Model):
 
     def save(self, *args, **kwargs):
         order_items = self.order_items.all()
-        self.value = order_items.aggregate(Sum('total_price'))['total_price__sum'] if order_items.exists() else 0.00
-        self.final_value = Decimal(self.value) - Decimal(self.discount)
+        self.value = order_items.aggregate(Sum('total_price'))['total_price__sum'] if order_items.exists() else 0
+        self.final_value = self.value - self.discount
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -47,13 +48,13 @@ class Order(models.Model):
         return reverse('delete_order', kwargs={'pk': self.id})
 
     def tag_final_value(self):
-        return f'{self.final_value} {CURRENCY}'
+        return f'{format_money(self.final_value)} {CURRENCY}'
 
     def tag_discount(self):
-        return f'{self.discount} {CURRENCY}'
+        return f'{format_money(self.discount)} {CURRENCY}'
 
     def tag_value(self):
-        return f'{self.value} {CURRENCY}'
+        return f'{format_money(self.value)} {CURRENCY}'
 
     @staticmethod
     def filter_data(request, queryset):
@@ -69,32 +70,43 @@ class Order(models.Model):
         return queryset
 
 
+class OrderToken(models.Model):
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='tokens')
+    token = models.CharField(max_length=150, db_index=True)
+
+    def __str__(self):
+        return self.token
+
+
 class OrderItem(models.Model):
     product = models.ForeignKey(Product, on_delete=models.PROTECT)
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='order_items')
     qty = models.PositiveIntegerField(default=1)
-    price = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
-    discount_price = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
-    final_price = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
-    total_price = models.DecimalField(default=0.00, decimal_places=2, max_digits=20)
+    price = MoneyField(default=0)
+    discount_price = MoneyField(default=0)
+    final_price = MoneyField(default=0)
+    total_price = MoneyField(default=0)
 
     def __str__(self):
         return f'{self.product.title}'
 
     def save(self,  *args, **kwargs):
         self.final_price = self.discount_price if self.discount_price > 0 else self.price
-        self.total_price = Decimal(self.qty) * Decimal(self.final_price)
+        self.total_price = self.qty * self.final_price
         super().save(*args, **kwargs)
         self.order.save()
 
     def tag_final_price(self):
-        return f'{self.final_price} {CURRENCY}'
+        return f'{format_money(self.final_price)} {CURRENCY}'
 
     def tag_discount(self):
-        return f'{self.discount_price} {CURRENCY}'
+        return f'{format_money(self.discount_price)} {CURRENCY}'
 
     def tag_price(self):
-        return f'{self.price} {CURRENCY}'
+        return f'{format_money(self.price)} {CURRENCY}'
+
+    def tag_total_price(self):
+        return f'{format_money(self.total_price)} {CURRENCY}'
 
 
 @receiver(post_delete, sender=OrderItem)
@@ -0,0 +1,135 @@
+import atexit
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+
+def frame_name(frame):
+    """ module:qualified name, so the render() or __call__() of different classes of a module stay apart. """
+    return f'{frame.f_globals.get("__name__", "?")}:{frame.f_code.co_qualname}'
+
+
+def fold(frame):
+    """ The stack of `frame` in the root;...;leaf format of flamegraph.pl and speedscope. """
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """ Records the stack of one thread every `interval` seconds from a background thread. """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            # the profiled thread may already be waiting in stop()
+            if frame is not None and not self.stopped.is_set():
+                self.stacks[fold(frame)] += 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        return self.stacks
+
+
+def write_stacks(view_name, bucket, stacks):
+    directory = os.path.join(settings.PROFILER_DIR, view_name.replace(':', '.'))
+    os.makedirs(directory, exist_ok=True)
+    # one append per flush, the workers of the host share the file of the hour
+    with open(os.path.join(directory, f'{bucket}.folded'), 'a') as f:
+        f.write(''.join(f'{stack} {count}\n' for stack, count in stacks.items()))
+
+
+class StackAggregator:
+    """
+    Sums the stacks of the profiled requests per view in memory and appends them to
+    PROFILER_DIR/<view name>/<hour>.folded at most every `flush_interval` seconds and at exit,
+    so the files grow with the distinct stacks of a flush, not with the number of requests.
+    """
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.stacks = defaultdict(Counter)
+        self.next_flush = time.monotonic() + flush_interval
+        atexit.register(self.flush)
+
+    def add(self, view_name, stacks):
+        with self.lock:
+            self.stacks[view_name].update(stacks)
+        if time.monotonic() >= self.next_flush:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending, self.stacks = self.stacks, defaultdict(Counter)
+            self.next_flush = time.monotonic() + self.flush_interval
+        bucket = time.strftime('%Y%m%dT%H')
+        for view_name, stacks in pending.items():
+            try:
+                write_stacks(view_name, bucket, stacks)
+            except OSError:
+                # never turn the response into a 500 or hide the exception of the view
+                logger.exception('Could not write the profile of %s to %s.', view_name, settings.PROFILER_DIR)
+
+
+class SamplingProfilerMiddleware:
+    """
+    Samples the stacks of PROFILER_SAMPLE_RATE of all requests and of every request to the url names
+    in PROFILER_ROUTES, summed into one folded stack file per view and hour under PROFILER_DIR/<view name>/.
+    With both settings empty the middleware removes itself, "manage.py profile_report" merges the files.
+    """
+
+    def __init__(self, get_response):
+        self.sample_rate = settings.PROFILER_SAMPLE_RATE
+        self.routes = set(settings.PROFILER_ROUTES)
+        if not self.sample_rate and not self.routes:
+            raise MiddlewareNotUsed
+        self.interval = settings.PROFILER_INTERVAL
+        self.aggregator = StackAggregator(settings.PROFILER_FLUSH_INTERVAL)
+        self.get_response = get_response
+
+    def should_profile(self, request):
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        if self.routes:
+            try:
+                return resolve(request.path_info).url_name in self.routes
+            except Resolver404:
+                return False
+        return False
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        try:
+            return self.get_response(request)
+        finally:
+            stacks = sampler.stop()
+            if stacks:
+                resolver_match = getattr(request, 'resolver_match', None)
+                self.aggregator.add(resolver_match.view_name if resolver_match else 'unresolved', stacks)
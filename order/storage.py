@@ -0,0 +1,70 @@
+import gzip
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile, File
+
+from order.assets import BUNDLE_DIR, BUNDLE_ROOT, build_bundles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE = ('.css', '.js', '.svg', '.html', '.txt', '.json', '.map', '.eot', '.ttf', '.otf')
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Fingerprints every collected file and writes .gz (and .br when brotli is installed) copies
+    next to the text ones. The ASSET_BUNDLES are rebuilt and collected on every run, so a plain
+    collectstatic deploy has the bundles the templates ask for. References the vendored css makes to files that don't exist are left
+    untouched instead of failing collectstatic.
+    """
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except (ValueError, SuspiciousFileOperation):
+            if content is not None:
+                raise
+            logger.warning('Static file %s could not be found, leaving its references unhashed.', name)
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths.update(self.collect_bundles())
+        yield from super().post_process(paths, dry_run, **options)
+        if not dry_run:
+            for hashed_name in set(self.hashed_files.values()):
+                if hashed_name.endswith(COMPRESSIBLE):
+                    self.compress(hashed_name)
+
+    def collect_bundles(self):
+        build_bundles()
+        paths = dict()
+        for name in settings.ASSET_BUNDLES:
+            path = f'{BUNDLE_DIR}/{name}'
+            if self.exists(path):
+                self.delete(path)
+            with open(os.path.join(BUNDLE_ROOT, name), 'rb') as f:
+                self._save(path, File(f))
+            paths[path] = (self, path)
+        return paths
+
+    def compress(self, name):
+        with self.open(name) as f:
+            content = f.read()
+        compressed = [('.gz', gzip.compress(content, compresslevel=9))]
+        if brotli is not None:
+            compressed.append(('.br', brotli.compress(content)))
+        for suffix, data in compressed:
+            if len(data) < len(content):
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(data))
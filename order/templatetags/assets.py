@@ -0,0 +1,22 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from order.assets import BUNDLE_DIR
+
+register = template.Library()
+
+TAGS = {
+    'css': '<link href="{}" rel="stylesheet" />',
+    'js': '<script src="{}"></script>',
+}
+
+
+@register.simple_tag
+def asset_bundle(name):
+    """ One tag for the fingerprinted bundle, or one tag per source file while ASSET_BUNDLES_ENABLED is off. """
+    tag = TAGS[name.rsplit('.', 1)[-1]]
+    if settings.ASSET_BUNDLES_ENABLED:
+        return format_html(tag, static(f'{BUNDLE_DIR}/{name}'))
+    return format_html_join('\n', tag, ((static(path), ) for path in settings.ASSET_BUNDLES[name]))
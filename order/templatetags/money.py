@@ -0,0 +1,10 @@
+from django import template
+
+from product.money import format_money
+
+register = template.Library()
+
+
+@register.filter
+def money(cents):
+    return format_money(cents) if cents is not None else ''
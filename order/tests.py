@@ -1,3 +1,272 @@
-from django.test import TestCase
+import gzip
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.http import Http404, HttpResponse
+from django.template import Context, Template
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, RequestFactory, override_settings
+from django.utils.http import http_date
+
+from product.models import Product, Category
+from product.cache import new_generation
+from .assets import build_css, rewrite_css_urls, serve_static
+from .backends import GENERATION_KEY, CachedModelBackend
+from .models import Order, OrderItem
+from .management.commands.profile_report import Command as ProfileReportCommand
+from .profiling import SamplingProfilerMiddleware, frame_name
+from .renderers import order_item_renderer, product_renderer
+
+
+class FastTableRendererTest(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        category = Category.objects.create(title='Drinks & <Snacks>')
+        self.cola = Product.objects.create(title='Cola "Zero"', category=category, value=250, qty=10)
+        self.water = Product.objects.create(title='Water', value=100, discount_value=80, qty=10)
+        self.order = Order.objects.create(title='Order - 1')
+        self.empty_order = Order.objects.create(title='Order - 2')
+        OrderItem.objects.create(order=self.order, product=self.cola, price=250)
+        OrderItem.objects.create(order=self.order, product=self.water, qty=3, price=100, discount_price=80)
+
+    def assertSameHtml(self, renderer, request, queryset, instance):
+        self.assertEqual(renderer.render(request, queryset, instance),
+                         renderer.render_fallback(request, queryset, instance))
+
+    def test_order_items(self):
+        for data in [{}, {'q': 'co<la&'}]:
+            request = self.factory.get('/', data)
+            self.assertSameHtml(order_item_renderer, request, self.order.order_items.all(), self.order)
+            self.assertSameHtml(order_item_renderer, request, self.empty_order.order_items.all(), self.empty_order)
+
+    def test_products(self):
+        for data in [{}, {'q': 'co<la&'}]:
+            request = self.factory.get('/', data)
+            self.assertSameHtml(product_renderer, request, Product.objects.all()[:12], self.order)
+            self.assertSameHtml(product_renderer, request, Product.objects.none(), self.order)
+
+
+class OrderAdminSearchTest(TestCase):
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'admin'))
+        self.first = Order.objects.create(title='Order - 17')
+        self.second = Order.objects.create(title='Table 4 order')
+        self.third = Order.objects.create(title='Takeaway')
+
+    def search(self, term):
+        response = self.client.get('/admin/order/order/', {'q': term})
+        return set(response.context['cl'].result_list)
+
+    def test_case_insensitive_word_prefixes(self):
+        self.assertEqual(self.search('order'), {self.first, self.second})
+        self.assertEqual(self.search('ORD 17'), {self.first})
+        self.assertEqual(self.search('tak'), {self.third})
+        self.assertEqual(self.search(str(self.third.id)), {self.third})
+
+    def test_tokens_follow_the_title(self):
+        self.third.title = 'Takeaway order'
+        self.third.save()
+        self.assertEqual(self.search('order'), {self.first, self.second, self.third})
+        Order.objects.get(id=self.third.id).save()
+        self.assertEqual(self.third.tokens.count(), 2)
+
+
+class SamplingProfilerTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def slow_view(self, request):
+        time.sleep(0.02)
+        return HttpResponse('ok')
+
+    def test_write_failure_keeps_the_response(self):
+        profiler_dir = os.path.join(self.directory.name, 'not-a-directory')
+        open(profiler_dir, 'w').close()
+        with override_settings(PROFILER_SAMPLE_RATE=1, PROFILER_DIR=profiler_dir, PROFILER_FLUSH_INTERVAL=0):
+            middleware = SamplingProfilerMiddleware(self.slow_view)
+            with self.assertLogs('order.profiling', 'ERROR'):
+                response = middleware(RequestFactory().get('/'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_stacks_are_summed_per_view_and_hour(self):
+        with override_settings(PROFILER_SAMPLE_RATE=1, PROFILER_DIR=self.directory.name, PROFILER_FLUSH_INTERVAL=60):
+            middleware = SamplingProfilerMiddleware(self.slow_view)
+            for i in range(3):
+                middleware(RequestFactory().get('/'))
+            self.assertEqual(os.listdir(self.directory.name), [])
+            middleware.aggregator.flush()
+            middleware(RequestFactory().get('/'))
+            middleware.aggregator.flush()
+            self.assertEqual(os.listdir(self.directory.name), ['unresolved'])
+            self.assertEqual(os.listdir(os.path.join(self.directory.name, 'unresolved')),
+                             [time.strftime('%Y%m%dT%H.folded')])
+            stacks, views = ProfileReportCommand().read_profiles(0, None)
+        # about 20 samples of 1 ms per request
+        self.assertGreater(views['unresolved'], 40)
+        self.assertTrue(any(stack.endswith('order.tests:SamplingProfilerTest.slow_view') for stack in stacks))
+
+    def test_frame_names_are_qualified(self):
+        class Header:
+            def render(self):
+                return sys._getframe()
+
+        class Cell:
+            def render(self):
+                return sys._getframe()
+
+        prefix = 'order.tests:SamplingProfilerTest.test_frame_names_are_qualified.<locals>'
+        self.assertEqual(frame_name(Header().render()), f'{prefix}.Header.render')
+        self.assertEqual(frame_name(Cell().render()), f'{prefix}.Cell.render')
+
+    def test_prune(self):
+        for name, age in [('old', 48), ('recent', 1)]:
+            os.makedirs(os.path.join(self.directory.name, name))
+            path = os.path.join(self.directory.name, name, 'profile.folded')
+            open(path, 'w').close()
+            os.utime(path, (time.time() - age * 3600, ) * 2)
+        with override_settings(PROFILER_DIR=self.directory.name):
+            call_command('profile_report', prune=24, stdout=StringIO())
+        self.assertEqual(os.listdir(self.directory.name), ['recent'])
+
+    def test_report_skips_stray_files(self):
+        os.makedirs(os.path.join(self.directory.name, 'homepage'))
+        with open(os.path.join(self.directory.name, 'homepage', 'profile.folded'), 'w') as f:
+            f.write('django:view;order.views:homepage 3\n')
+        open(os.path.join(self.directory.name, 'notes.txt'), 'w').close()
+        with override_settings(PROFILER_DIR=self.directory.name):
+            stacks, views = ProfileReportCommand().read_profiles(0, None)
+        self.assertEqual(views, Counter(homepage=3))
+        self.assertEqual(stacks, Counter({'django:view;order.views:homepage': 3}))
+
+
+class AssetBundleTest(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+
+    def write(self, path, content, mode='w'):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, mode) as f:
+            f.write(content)
+
+    def test_rewrite_css_urls(self):
+        css = ('a{background:url(../img/a.png)} b{src:url("fonts/x.woff?v=1#iefix")} '
+               'c{background:url(data:image/png;base64,AA==)} d{background:url(https://cdn/x.png)} '
+               'e{background:url(/media/e.png)} f{background:url(../../../outside.png)}')
+        self.assertEqual(rewrite_css_urls(css, 'dist/css/style.css'), (
+            'a{background:url(../dist/img/a.png)} b{src:url("../dist/css/fonts/x.woff?v=1#iefix")} '
+            'c{background:url(data:image/png;base64,AA==)} d{background:url(https://cdn/x.png)} '
+            'e{background:url(/media/e.png)} f{background:url(../../../outside.png)}'
+        ))
+
+    def test_build_css_inlines_local_imports(self):
+        self.write('css/main.css', '@import url("base.css");\n@import url(https://fonts.example.com/css?family=X);\n'
+                                   'body{background:url(../img/bg.png)}')
+        self.write('css/base.css', '@import "main.css";\nh1{background:url(h.png)}')
+        with override_settings(STATICFILES_DIRS=[self.root]):
+            content, sources = build_css(['css/main.css', 'css/base.css'])
+        self.assertTrue(content.startswith('@import url(https://fonts.example.com/css?family=X);\n'))
+        self.assertEqual(content.count('@import'), 1)
+        self.assertEqual(content.count('h1{background:url(../css/h.png)}'), 1)
+        self.assertEqual(content.count('body{background:url(../img/bg.png)}'), 1)
+        self.assertLess(content.index('h1{'), content.index('body{'))
+        self.assertEqual(sources, {'css/main.css', 'css/base.css'})
+
+    def serve(self, path, **headers):
+        with override_settings(STATIC_ROOT=self.root), \
+                mock.patch('order.assets.hashed_paths', return_value=frozenset(['bundles/app.1a2b.css'])):
+            return serve_static(RequestFactory().get('/', **headers), path)
+
+    def test_serve_static(self):
+        content = b'body{color:red}' * 20
+        self.write('bundles/app.1a2b.css', content, 'wb')
+        self.write('bundles/app.1a2b.css.gz', gzip.compress(content), 'wb')
+        self.write('bundles/app.1a2b.css.br', b'brotli', 'wb')
+        self.write('bundles/app.css', content, 'wb')
+
+        for accept_encoding, encoding, body in [('gzip, deflate, br', 'br', b'brotli'),
+                                                ('gzip', 'gzip', gzip.compress(content)),
+                                                ('', None, content)]:
+            response = self.serve('bundles/app.1a2b.css', HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertEqual(response.get('Content-Encoding'), encoding)
+            self.assertEqual(b''.join(response.streaming_content), body)
+            self.assertEqual(response['Content-Type'], 'text/css')
+            self.assertEqual(response['Vary'], 'Accept-Encoding')
+            self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertEqual(self.serve('bundles/app.css')['Cache-Control'], 'no-cache')
+        modified = os.path.getmtime(os.path.join(self.root, 'bundles/app.css'))
+        response = self.serve('bundles/app.css', HTTP_IF_MODIFIED_SINCE=http_date(modified + 1))
+        self.assertEqual(response.status_code, 304)
+        for path in ['bundles/missing.css', 'bundles', '../../etc/passwd']:
+            with self.assertRaises(Http404):
+                self.serve(path)
+
+    @override_settings(ASSET_BUNDLES={'app.css': ['a.css', 'dist/b.css'], 'app.js': ['a.js']})
+    def test_asset_bundle_tag(self):
+        template = Template('{% load assets %}{% asset_bundle "app.css" %}|{% asset_bundle "app.js" %}')
+        with override_settings(ASSET_BUNDLES_ENABLED=True):
+            self.assertEqual(template.render(Context()), '<link href="/static/bundles/app.css" rel="stylesheet" />|'
+                                                         '<script src="/static/bundles/app.js"></script>')
+        with override_settings(ASSET_BUNDLES_ENABLED=False):
+            self.assertEqual(template.render(Context()), '<link href="/static/a.css" rel="stylesheet" />\n'
+                                                         '<link href="/static/dist/b.css" rel="stylesheet" />|'
+                                                         '<script src="/static/a.js"></script>')
+
+
+class CachedModelBackendTest(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        CachedModelBackend.users.clear()
+        self.addCleanup(CachedModelBackend.users.clear)
+        self.user = User.objects.create_user('cashier', password='cashier', is_staff=True)
+        self.backend = CachedModelBackend()
+
+    def test_cache_hit(self):
+        self.assertEqual(self.backend.get_user(self.user.id), self.user)
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.id)
+        self.assertEqual(user, self.user)
+        # callers get their own copy
+        self.assertIsNot(user, self.backend.get_user(self.user.id))
+
+    @override_settings(STAFF_USER_CACHE_TTL=30)
+    def test_ttl_expiry(self):
+        self.backend.get_user(self.user.id)
+        with mock.patch('order.backends.time.monotonic', return_value=time.monotonic() + 31):
+            with self.assertNumQueries(1):
+                self.backend.get_user(self.user.id)
+
+    def test_invalidated_by_save_and_delete(self):
+        self.backend.get_user(self.user.id)
+        key = GENERATION_KEY.format(self.user.id)
+        generation = cache.get(key)
+        self.user.is_active = False
+        self.user.save()
+        # the other processes see the new generation
+        self.assertNotEqual(cache.get(key), generation)
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.backend.get_user(self.user.id))
+        user_id = self.user.id
+        self.user.delete()
+        self.assertIsNone(self.backend.get_user(user_id))
+
+    def test_invalidated_by_another_process(self):
+        self.backend.get_user(self.user.id)
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        new_generation(GENERATION_KEY.format(self.user.id))
+        self.assertIsNone(self.backend.get_user(self.user.id))
@@ -11,7 +11,10 @@ from django_tables2 import RequestConfig
 from .models import Order, OrderItem, CURRENCY
 from .forms import OrderCreateForm, OrderEditForm
 from product.models import Product, Category
-from .tables import ProductTable, OrderItemTable, OrderTable
+from product.barcodes import barcode_index
+from product.money import format_money
+from .tables import OrderTable
+from .renderers import order_item_renderer, product_renderer
 
 import datetime
 
@@ -31,9 +34,9 @@ class HomepageView(ListView):
         remaining = total_sales - paid_value
         diviner = total_sales if total_sales > 0 else 1
         paid_percent, remain_percent = round((paid_value/diviner)*100, 1), round((remaining/diviner)*100, 1)
-        total_sales = f'{total_sales} {CURRENCY}'
-        paid_value = f'{paid_value} {CURRENCY}'
-        remaining = f'{remaining} {CURRENCY}'
+        total_sales = f'{format_money(total_sales)} {CURRENCY}'
+        paid_value = f'{format_money(paid_value)} {CURRENCY}'
+        remaining = f'{format_money(remaining)} {CURRENCY}'
         orders = OrderTable(orders)
         RequestConfig(self.request).configure(orders)
         context.update(locals())
@@ -102,10 +105,8 @@ class OrderUpdateView(UpdateView):
         context = super().get_context_data(**kwargs)
         instance = self.object
         qs_p = Product.objects.filter(active=True)[:12]
-        products = ProductTable(qs_p)
-        order_items = OrderItemTable(instance.order_items.all())
-        RequestConfig(self.request).configure(products)
-        RequestConfig(self.request).configure(order_items)
+        products = product_renderer.render(self.request, qs_p, instance)
+        order_items = order_item_renderer.render(self.request, instance.order_items.all(), instance)
         context.update(locals())
         return context
 
@@ -126,10 +127,7 @@ def done_order_view(request, pk):
     return redirect(reverse('homepage'))
 
 
-@staff_member_required
-def ajax_add_product(request, pk, dk):
-    instance = get_object_or_404(Order, id=pk)
-    product = get_object_or_404(Product, id=dk)
+def add_product_to_order(request, instance, product):
     order_item, created = OrderItem.objects.get_or_create(order=instance, product=product)
     if created:
         order_item.qty = 1
@@ -141,8 +139,7 @@ def ajax_add_product(request, pk, dk):
     product.qty -= 1
     product.save()
     instance.refresh_from_db()
-    order_items = OrderItemTable(instance.order_items.all())
-    RequestConfig(request).configure(order_items)
+    order_items = order_item_renderer.render(request, instance.order_items.all(), instance)
     data = dict()
     data['result'] = render_to_string(template_name='include/order_container.html',
                                       request=request,
@@ -153,6 +150,31 @@ def ajax_add_product(request, pk, dk):
     return JsonResponse(data)
 
 
+@staff_member_required
+def ajax_add_product(request, pk, dk):
+    instance = get_object_or_404(Order, id=pk)
+    product = get_object_or_404(Product, id=dk)
+    return add_product_to_order(request, instance, product)
+
+
+@staff_member_required
+def ajax_scan_product(request, pk):
+    instance = get_object_or_404(Order, id=pk)
+    code = request.GET.get('code', '').strip()
+    product_id = barcode_index.get(code) if code else None
+    if product_id is None:
+        return JsonResponse({'error': f'No product with barcode {code}'}, status=404)
+    product = Product.objects.filter(id=product_id).first()
+    if product is None:
+        # the index is stale, the barcode was moved or its product deleted since it was loaded
+        barcode_index.evict(code)
+        product_id = barcode_index.get(code)
+        product = Product.objects.filter(id=product_id).first() if product_id is not None else None
+    if product is None:
+        return JsonResponse({'error': f'No product with barcode {code}'}, status=404)
+    return add_product_to_order(request, instance, product)
+
+
 @staff_member_required
 def ajax_modify_order_item(request, pk, action):
     order_item = get_object_or_404(OrderItem, id=pk)
@@ -171,8 +193,7 @@ def ajax_modify_order_item(request, pk, action):
         order_item.delete()
     data = dict()
     instance.refresh_from_db()
-    order_items = OrderItemTable(instance.order_items.all())
-    RequestConfig(request).configure(order_items)
+    order_items = order_item_renderer.render(request, instance.order_items.all(), instance)
     data['result'] = render_to_string(template_name='include/order_container.html',
                                       request=request,
                                       context={
@@ -188,9 +209,7 @@ def ajax_search_products(request, pk):
     instance = get_object_or_404(Order, id=pk)
     q = request.GET.get('q', None)
     products = Product.broswer.active().filter(title__startswith=q) if q else Product.broswer.active()
-    products = products[:12]
-    products = ProductTable(products)
-    RequestConfig(request).configure(products)
+    products = product_renderer.render(request, products[:12], instance)
     data = dict()
     data['products'] = render_to_string(template_name='include/product_container.html',
                                         request=request,
@@ -221,8 +240,9 @@ def ajax_calculate_results_view(request):
         total_paid_value = orders.filter(is_paid=True).aggregate(Sum('final_value'))['final_value__sum'] if\
             orders.filter(is_paid=True) else 0
         remaining_value = total_value - total_paid_value
-    total_value, total_paid_value, remaining_value = f'{total_value} {CURRENCY}',\
-                                                     f'{total_paid_value} {CURRENCY}', f'{remaining_value} {CURRENCY}'
+    total_value, total_paid_value, remaining_value = f'{format_money(total_value)} {CURRENCY}',\
+                                                     f'{format_money(total_paid_value)} {CURRENCY}',\
+                                                     f'{format_money(remaining_value)} {CURRENCY}'
     data['result'] = render_to_string(template_name='include/result_container.html',
                                       request=request,
                                       context=locals())
@@ -1,15 +1,34 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
 
-from .models import Category, Product
+from .models import Category, Product, Barcode
+from .paginators import EstimatedCountPaginator
+
+
+class ScalableModelAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            requested_page = int(request.GET.get(PAGE_VAR, 0)) + 1
+        except ValueError:
+            requested_page = 1
+        return self.paginator(queryset, per_page, orphans, allow_empty_first_page, requested_page=requested_page)
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
-    search_fields = ['title']
+class CategoryAdmin(ScalableModelAdmin):
+    search_fields = ['^title']
+
+
+class BarcodeInline(admin.TabularInline):
+    model = Barcode
+    extra = 1
 
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(ScalableModelAdmin):
     list_display = ['title', 'category', 'tag_final_value', 'qty', 'active']
     list_select_related = ['category']
     list_filter = ['active', 'category']
@@ -18,3 +37,18 @@ class ProductAdmin(admin.ModelAdmin):
     fields = ['active', 'title', 'category', 'qty', 'value', 'discount_value', 'tag_final_value']
     autocomplete_fields = ['category']
     readonly_fields = ['tag_final_value']
+    inlines = [BarcodeInline]
+    actions = ['activate', 'deactivate']
+
+    def get_search_results(self, request, queryset, search_term):
+        return queryset.filter(Product.search_q(search_term)), False
+
+    def activate(self, request, queryset):
+        updated = queryset.update(active=True)
+        self.message_user(request, f'{updated} products activated.')
+    activate.short_description = 'Activate selected products'
+
+    def deactivate(self, request, queryset):
+        updated = queryset.update(active=False)
+        self.message_user(request, f'{updated} products deactivated.')
+    deactivate.short_description = 'Deactivate selected products'
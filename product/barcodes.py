@@ -0,0 +1,64 @@
+import time
+from threading import Lock
+
+from .cache import current_generation, new_generation
+
+GENERATION_KEY = 'barcodes:generation'
+
+
+class BarcodeIndex:
+    """
+    Per process barcode -> product id map, loaded on first use. Saving or deleting a Barcode changes
+    the generation token in the shared cache once the transaction commits. Every process reads the
+    token at most once per `check_interval` seconds and reloads its map when it didn't load with it.
+    Codes the map doesn't know yet are picked up by the database fallback in get().
+    """
+    check_interval = 1
+
+    def __init__(self):
+        self.lock = Lock()
+        self.codes = None
+        self.generation = None
+        self.next_check = 0
+
+    def load(self, generation):
+        from .models import Barcode
+        self.codes = dict(Barcode.objects.values_list('code', 'product_id'))
+        self.generation = generation
+
+    def ensure_loaded(self):
+        now = time.monotonic()
+        if self.codes is not None and now < self.next_check:
+            return
+        generation = current_generation(GENERATION_KEY)
+        self.next_check = now + self.check_interval
+        if self.codes is None or self.generation != generation:
+            with self.lock:
+                if self.codes is None or self.generation != generation:
+                    self.load(generation)
+
+    def clear(self):
+        with self.lock:
+            self.codes, self.generation, self.next_check = None, None, 0
+
+    def invalidate(self):
+        new_generation(GENERATION_KEY)
+        # this process sees its own change on the next lookup, the others within check_interval
+        self.next_check = 0
+
+    def get(self, code):
+        self.ensure_loaded()
+        product_id = self.codes.get(code)
+        if product_id is None:
+            from .models import Barcode
+            product_id = Barcode.objects.filter(code=code).values_list('product_id', flat=True).first()
+            if product_id is not None:
+                self.codes[code] = product_id
+        return product_id
+
+    def evict(self, code):
+        if self.codes is not None:
+            self.codes.pop(code, None)
+
+
+barcode_index = BarcodeIndex()
@@ -0,0 +1,19 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+
+def current_generation(key):
+    """
+    The token a process compares with the one it built its local copy with, a key that was never
+    set or got evicted gets a fresh token, so it can only cause an extra reload, never a stale hit.
+    """
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def new_generation(key):
+    cache.set(key, uuid4().hex, None)
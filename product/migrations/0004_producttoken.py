@@ -0,0 +1,29 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from product.search import build_search_tokens
+
+
+def build_tokens(apps, schema_editor):
+    build_search_tokens(apps.get_model('product', 'Product'), apps.get_model('product', 'ProductToken'), 'product_id')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0003_barcode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(db_index=True, max_length=150)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tokens', to='product.Product')),
+            ],
+        ),
+        migrations.RunPython(build_tokens, migrations.RunPython.noop),
+    ]
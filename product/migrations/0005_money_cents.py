@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from product.money import cents_operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0004_producttoken'),
+    ]
+
+    operations = [
+        *cents_operations('product', 'product', 'value', 10),
+        *cents_operations('product', 'product', 'discount_value', 10),
+        *cents_operations('product', 'product', 'final_value', 10),
+    ]
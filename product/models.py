@@ -1,6 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
 from .managers import ProductManager
+from .barcodes import barcode_index
+from .search import SearchTokensMixin
+from .money import MoneyField, format_money
 
 CURRENCY = settings.CURRENCY
 
@@ -15,13 +20,13 @@ class Category(models.Model):
         return self.title
 
 
-class Product(models.Model):
+class Product(SearchTokensMixin, models.Model):
     active = models.BooleanField(default=True)
     title = models.CharField(max_length=150, unique=True)
     category = models.ForeignKey(Category, null=True, on_delete=models.SET_NULL)
-    value = models.DecimalField(default=0.00, decimal_places=2, max_digits=10)
-    discount_value = models.DecimalField(default=0.00, decimal_places=2, max_digits=10)
-    final_value = models.DecimalField(default=0.00, decimal_places=2, max_digits=10)
+    value = MoneyField(default=0)
+    discount_value = MoneyField(default=0)
+    final_value = MoneyField(default=0)
     qty = models.PositiveIntegerField(default=0)
 
     objects = models.Manager()
@@ -38,5 +43,27 @@ class Product(models.Model):
         return self.title
 
     def tag_final_value(self):
-        return f'{self.final_value} {CURRENCY}'
-    tag_final_value.short_description = 'Value'
\ No newline at end of file
+        return f'{format_money(self.final_value)} {CURRENCY}'
+    tag_final_value.short_description = 'Value'
+
+
+class Barcode(models.Model):
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='barcodes')
+    code = models.CharField(max_length=64, unique=True)
+
+    def __str__(self):
+        return self.code
+
+
+class ProductToken(models.Model):
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='tokens')
+    token = models.CharField(max_length=150, db_index=True)
+
+    def __str__(self):
+        return self.token
+
+
+@receiver(post_save, sender=Barcode)
+@receiver(post_delete, sender=Barcode)
+def invalidate_barcode_index(sender, instance, **kwargs):
+    transaction.on_commit(barcode_index.invalidate)
@@ -0,0 +1,81 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from django import forms
+from django.db import migrations, models
+from django.db.models import ExpressionWrapper, F, Value
+from django.db.models.functions import Round
+
+CENT = Decimal('0.01')
+
+
+def to_cents(value):
+    """ Converts an amount like Decimal('2.50') or '2.5' to integer cents. """
+    return int((Decimal(str(value)) / CENT).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_decimal(cents):
+    return (Decimal(cents) * CENT).quantize(CENT)
+
+
+def format_money(cents):
+    sign = '-' if cents < 0 else ''
+    units, cents = divmod(abs(cents), 100)
+    return f'{sign}{units}.{cents:02d}'
+
+
+class MoneyFormField(forms.DecimalField):
+    """ Shows and accepts amounts with two decimals, cleans them to integer cents. """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('decimal_places', 2)
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value):
+        return to_decimal(value) if isinstance(value, int) else value
+
+    def clean(self, value):
+        value = super().clean(value)
+        return None if value is None else to_cents(value)
+
+    def has_changed(self, initial, data):
+        try:
+            data = self.clean(data)
+        except forms.ValidationError:
+            return True
+        return initial != data
+
+
+class MoneyField(models.BigIntegerField):
+    """ An amount stored as integer cents, so sums and multiplications stay integer in Python and SQL. """
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': MoneyFormField, **kwargs})
+
+
+def cents_operations(app_label, model_name, field_name, max_digits):
+    """
+    Migration operations moving a DecimalField of `max_digits` to a MoneyField through a temporary
+    column, converting the amounts both ways.
+    """
+    cents_name = f'{field_name}_cents'
+
+    def forwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        model.objects.update(**{cents_name: ExpressionWrapper(Round(F(field_name) * 100),
+                                                              output_field=models.BigIntegerField())})
+
+    def backwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        # a decimal divisor, SQLite would bind Decimal('100') as an integer and divide integers
+        model.objects.update(**{field_name: ExpressionWrapper(
+            F(cents_name) / Value(Decimal('100.00')),
+            output_field=models.DecimalField(decimal_places=2, max_digits=max_digits)
+        )})
+
+    return [
+        migrations.AddField(model_name, cents_name, models.BigIntegerField(default=0)),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(model_name, field_name),
+        migrations.RenameField(model_name, cents_name, field_name),
+        migrations.AlterField(model_name, field_name, MoneyField(default=0)),
+    ]
@@ -0,0 +1,28 @@
+from django.core.paginator import Paginator
+from django.db.models import Max
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Counts at most `limit` rows, or up to the page after `requested_page` when that is further.
+    Past that an unfiltered queryset is estimated from the highest primary key and a filtered one
+    is capped at the bound, so the admin changelists never run a full COUNT(*) on the big tables
+    and the next page of a capped result always stays reachable.
+    """
+    limit = 10000
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, requested_page=1):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.requested_page = requested_page
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        limit = max(self.limit, (self.requested_page + 1) * self.per_page)
+        count = queryset.order_by()[:limit + 1].count()
+        if count <= limit:
+            return count
+        if queryset.query.where:
+            return limit
+        return queryset.model._default_manager.aggregate(max_pk=Max('pk'))['max_pk'] or count
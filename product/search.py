@@ -0,0 +1,70 @@
+import re
+
+from django.db.models import Q
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return sorted(set(TOKEN_RE.findall(text.lower())))
+
+
+def prefix_q(field, term):
+    """
+    Matches values of `field` starting with `term`. The range lets the database walk the btree index
+    of the column, startswith alone would compile to a LIKE that most backends can't index.
+    """
+    successor = term[:-1] + chr(ord(term[-1]) + 1)
+    return Q(**{f'{field}__gte': term, f'{field}__lt': successor, f'{field}__startswith': term})
+
+
+def build_search_tokens(model, token_model, field_name, text_field='title'):
+    """ Creates the tokens of every row of `model`, for the data migrations working on historical models. """
+    token_model.objects.bulk_create(
+        [token_model(**{field_name: pk, 'token': token})
+         for pk, text in model.objects.values_list('pk', text_field).iterator()
+         for token in tokenize(text)],
+        batch_size=500
+    )
+
+
+class SearchTokensMixin:
+    """
+    Keeps one lower-cased token per word of `search_field` in the model behind the `tokens_name`
+    reverse relation, so searches match word prefixes through its index instead of a LIKE scan.
+    save() only rebuilds the tokens when the field changed since the instance was loaded.
+    """
+    search_field = 'title'
+    tokens_name = 'tokens'
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._indexed_text = instance.__dict__.get(cls.search_field)
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if getattr(self, self.search_field) != getattr(self, '_indexed_text', None):
+            self.update_search_tokens()
+
+    @classmethod
+    def token_relation(cls):
+        relation = cls._meta.get_field(cls.tokens_name)
+        return relation.related_model, relation.field
+
+    def update_search_tokens(self):
+        token_model, field = self.token_relation()
+        text = getattr(self, self.search_field)
+        getattr(self, self.tokens_name).all().delete()
+        token_model.objects.bulk_create([token_model(**{field.name: self, 'token': token}) for token in tokenize(text)])
+        self._indexed_text = text
+
+    @classmethod
+    def search_q(cls, search_term, field='id'):
+        """ Matches the rows whose `field` holds an instance with a token starting with every word of `search_term`. """
+        token_model, relation_field = cls.token_relation()
+        q = Q()
+        for term in tokenize(search_term):
+            q &= Q(**{f'{field}__in': token_model.objects.filter(prefix_q('token', term)).values(relation_field.attname)})
+        return q
@@ -1,3 +1,162 @@
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+
+from order.models import Order, OrderItem
+from .barcodes import GENERATION_KEY, barcode_index
+from .models import Product, Barcode
+from .money import MoneyFormField, format_money, to_cents, to_decimal
+from .paginators import EstimatedCountPaginator
+
+
+class BarcodeIndexTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        barcode_index.clear()
+        self.product = Product.objects.create(title='Cola', value=250, final_value=250, qty=10)
+        Barcode.objects.create(product=self.product, code='5201234567890')
+
+    def tearDown(self):
+        barcode_index.clear()
+
+    def test_reloads_when_the_generation_changes(self):
+        self.assertEqual(barcode_index.get('5201234567890'), self.product.id)
+        water = Product.objects.create(title='Water', value=100, final_value=100, qty=10)
+        Barcode.objects.filter(code='5201234567890').update(product=water)
+        # another process committed a change, this one notices it at the next check
+        cache.set(GENERATION_KEY, 'another process')
+        self.assertEqual(barcode_index.get('5201234567890'), self.product.id)
+        with mock.patch('product.barcodes.time.monotonic', return_value=time.monotonic() + 2):
+            self.assertEqual(barcode_index.get('5201234567890'), water.id)
+
+    def test_own_changes_are_seen_immediately(self):
+        self.assertEqual(barcode_index.get('5201234567890'), self.product.id)
+        Barcode.objects.filter(code='5201234567890').update(code='5200000000000')
+        barcode_index.invalidate()
+        self.assertEqual(barcode_index.get('5200000000000'), self.product.id)
+        self.assertNotIn('5201234567890', barcode_index.codes)
+
+    def test_scan_of_a_stale_code(self):
+        user = User.objects.create_user('staff', password='staff', is_staff=True)
+        self.client.force_login(user)
+        order = Order.objects.create(title='Order - 1')
+        url = reverse('ajax_scan', kwargs={'pk': order.id})
+        barcode_index.ensure_loaded()
+        # deleted by another process before its generation change reached this one
+        barcode_index.codes['5201234567890'] = self.product.id + 1000
+        barcode_index.codes['5209999999999'] = self.product.id + 1000
+        response = self.client.get(url, {'code': '5209999999999'})
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('error', response.json())
+        response = self.client.get(url, {'code': '5201234567890'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(order.order_items.get().product, self.product)
+
+
+class EstimatedCountPaginatorTest(TestCase):
+
+    def setUp(self):
+        Product.objects.bulk_create([Product(title=f'Product {i}') for i in range(30)])
+        self.queryset = Product.objects.filter(active=True).order_by('id')
+
+    def paginator(self, requested_page):
+        paginator = EstimatedCountPaginator(self.queryset, 5, requested_page=requested_page)
+        paginator.limit = 10
+        return paginator
+
+    def test_exact_count_below_the_bound(self):
+        paginator = EstimatedCountPaginator(self.queryset, 5)
+        self.assertEqual(paginator.count, 30)
+
+    def test_capped_count_reaches_the_next_page(self):
+        self.assertEqual(self.paginator(1).num_pages, 2)
+        for requested_page in [2, 4]:
+            paginator = self.paginator(requested_page)
+            self.assertEqual(paginator.num_pages, requested_page + 1)
+            self.assertEqual(len(paginator.page(requested_page + 1)), 5)
+        self.assertEqual(self.paginator(6).count, 30)
+
+
+class MoneyTest(TestCase):
+
+    def test_to_cents_rounds_half_up(self):
+        self.assertEqual(to_cents('12.345'), 1235)
+        self.assertEqual(to_cents('12.344'), 1234)
+        self.assertEqual(to_cents(Decimal('2.5')), 250)
+        self.assertEqual(to_cents(7), 700)
+        self.assertEqual(to_cents('-0.005'), -1)
+
+    def test_format_money(self):
+        self.assertEqual(format_money(0), '0.00')
+        self.assertEqual(format_money(5), '0.05')
+        self.assertEqual(format_money(99), '0.99')
+        self.assertEqual(format_money(123456), '1234.56')
+        self.assertEqual(format_money(-5), '-0.05')
+        self.assertEqual(format_money(-1250), '-12.50')
+
+    def test_form_field_round_trip(self):
+        field = MoneyFormField()
+        self.assertEqual(field.prepare_value(1250), Decimal('12.50'))
+        self.assertEqual(field.prepare_value('12.5'), '12.5')
+        self.assertEqual(field.clean('12.5'), 1250)
+        self.assertEqual(field.clean(field.prepare_value(1999)), 1999)
+        self.assertEqual(to_decimal(field.clean('0.07')), Decimal('0.07'))
+        self.assertIsNone(MoneyFormField(required=False).clean(''))
+        self.assertFalse(field.has_changed(1250, '12.50'))
+        self.assertTrue(field.has_changed(1250, '12.51'))
+
+    def test_order_totals_are_integer_cents(self):
+        cola = Product.objects.create(title='Cola', value=250, qty=10)
+        water = Product.objects.create(title='Water', value=100, discount_value=85, qty=10)
+        order = Order.objects.create(title='Order - 1', discount=15)
+        cola_item = OrderItem.objects.create(order=order, product=cola, qty=3, price=cola.value)
+        water_item = OrderItem.objects.create(order=order, product=water, qty=2, price=water.value,
+                                              discount_price=water.discount_value)
+        self.assertEqual((cola_item.final_price, cola_item.total_price), (250, 750))
+        self.assertEqual((water_item.final_price, water_item.total_price), (85, 170))
+        order.refresh_from_db()
+        self.assertEqual((order.value, order.final_value), (920, 905))
+        self.assertIsInstance(order.value, int)
+        self.assertEqual(order.tag_final_value(), '9.05 €')
+
+
+class ProductAdminSearchTest(TestCase):
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'admin'))
+        self.cola = Product.objects.create(title='Coca-Cola Zero 330ml')
+        self.pepsi = Product.objects.create(title='Pepsi Cola')
+        self.water = Product.objects.create(title='Water')
+        order = Order.objects.create(title='Order - 1')
+        self.items = {product: OrderItem.objects.create(order=order, product=product)
+                      for product in [self.cola, self.pepsi, self.water]}
+
+    def search(self, url, term):
+        response = self.client.get(url, {'q': term})
+        return set(response.context['cl'].result_list)
+
+    def test_products(self):
+        url = '/admin/product/product/'
+        self.assertEqual(self.search(url, 'cola'), {self.cola, self.pepsi})
+        self.assertEqual(self.search(url, 'COLA zer'), {self.cola})
+        self.assertEqual(self.search(url, '330'), {self.cola})
+        self.assertEqual(self.search(url, 'ola'), set())
+        self.assertEqual(self.search(url, ''), {self.cola, self.pepsi, self.water})
+
+    def test_tokens_follow_the_title(self):
+        self.water.title = 'Sparkling Water'
+        self.water.save()
+        self.assertEqual(self.search('/admin/product/product/', 'spark'), {self.water})
+        self.assertEqual(sorted(self.water.tokens.values_list('token', flat=True)), ['sparkling', 'water'])
 
-# Create your tests here.
+    def test_order_items(self):
+        url = '/admin/order/orderitem/'
+        self.assertEqual(self.search(url, 'pep'), {self.items[self.pepsi]})
+        self.assertEqual(self.search(url, 'cola'), {self.items[self.cola], self.items[self.pepsi]})
+        self.assertEqual(self.search(url, str(self.cola.id + 1000)), set())